@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""为角色立绘生成显示尺寸的 PNG/WebP 变体及 srcset 清单
+
+surBig / hunBig / surHalf 以原始分辨率保存，而前台组件的显示框远小于原图，
+页面每次都要解码并缩放整张大图。本脚本按组件的实际显示尺寸生成 1x/1.5x/2x
+变体，并输出 manifest.json，页面可据此选择足够清晰的最小图片。
+
+用法: python scripts/generate-display-variants.py [--force] [--workers N]
+"""
+
+import argparse
+import io
+import json
+import os
+import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+try:
+    from PIL import Image
+except ImportError:
+    print("✗ 需要安装Pillow库")
+    print("  运行: pip install Pillow")
+    sys.exit(1)
+
+# 路径定义（相对于仓库根目录）
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+ASSETS_DIR = os.path.join(ROOT_DIR, 'assets')
+OUTPUT_DIR = os.path.join(ASSETS_DIR, 'display')
+MANIFEST_PATH = os.path.join(OUTPUT_DIR, 'manifest.json')
+
+# 各目录在前台中的显示框尺寸（与 pages/js/frontend-main.js 的 defaultLayout 一致）
+# 图片以 object-fit: contain 方式放入显示框
+DISPLAY_BOXES = {
+    'surBig': (220, 260),   # survivor1-4 全身模式
+    'surHalf': (220, 260),  # survivor1-4 半身模式（Ban位 50/60px 使用 1x 即可）
+    'hunBig': (340, 420),   # hunter 全身模式
+}
+
+# 设备像素比
+SCALES = (1, 1.5, 2)
+
+PNG_OPTIONS = {'format': 'PNG', 'optimize': True}
+WEBP_OPTIONS = {'format': 'WEBP', 'quality': 80, 'alpha_quality': 80, 'method': 6}
+
+
+def fit_size(src_size, box_size, scale):
+    """按 contain 方式计算放入显示框后的像素尺寸，不放大原图"""
+    src_w, src_h = src_size
+    ratio = min(box_size[0] * scale / src_w, box_size[1] * scale / src_h, 1.0)
+    return max(1, round(src_w * ratio)), max(1, round(src_h * ratio))
+
+
+def format_scale(scale):
+    return f"{scale:g}x"
+
+
+def encode(img, **options):
+    buf = io.BytesIO()
+    img.save(buf, **options)
+    return buf.getvalue()
+
+
+def encode_png(img, palette_only):
+    """返回较小的 PNG 编码；原图为调色板时只做量化版本"""
+    quantized = encode(img.quantize(256, method=Image.Quantize.FASTOCTREE), **PNG_OPTIONS)
+    if palette_only:
+        return quantized
+    return min(quantized, encode(img, **PNG_OPTIONS), key=len)
+
+
+def write_bytes(path, data):
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def is_entry_up_to_date(entry, src_path):
+    """上次清单中的条目仍然有效：引用的文件都存在且不早于原图"""
+    if not entry:
+        return False
+    src_mtime = os.path.getmtime(src_path)
+    for v in entry.get('variants', []):
+        for key in ('png', 'webp'):
+            if key not in v:
+                continue
+            path = os.path.join(ASSETS_DIR, v[key])
+            if not os.path.exists(path) or os.path.getmtime(path) < src_mtime:
+                return False
+    return True
+
+
+def build_variants(folder, fname, box):
+    """生成单张图片的全部变体，保证每个变体都不大于原图"""
+    name = os.path.splitext(fname)[0]
+    src_path = os.path.join(ASSETS_DIR, folder, fname)
+    src_bytes = os.path.getsize(src_path)
+
+    with Image.open(src_path) as img:
+        img.load()
+        src_size = img.size
+        # 原图已由 optimize-images-png-lossy.js 量化为调色板时，变体同样只用量化编码
+        palette_only = img.mode == 'P'
+        # 有透明通道才转 RGBA，部分原图实际是 JPEG（RGB），加 alpha 只会变大
+        has_alpha = img.mode in ('RGBA', 'LA') or 'transparency' in img.info
+        img = img.convert('RGBA' if has_alpha else 'RGB')
+
+    variants = []
+    copied_source = False
+    seen_sizes = set()
+    for scale in SCALES:
+        size = fit_size(src_size, box, scale)
+        png_data = None
+        if size != src_size:
+            resized = img.resize(size, Image.Resampling.LANCZOS)
+            png_data = encode_png(resized, palette_only)
+            # 缩小后仍不比原图小，直接用原图
+            if len(png_data) >= src_bytes:
+                png_data = None
+        if png_data is None:
+            size, resized = src_size, img
+        # 原图不够大时，多个倍率会得到相同尺寸，只保留一份
+        if size in seen_sizes:
+            continue
+        seen_sizes.add(size)
+
+        base = f"{name}@{format_scale(scale)}"
+        png_rel = f"display/{folder}/{base}.png"
+        png_path = os.path.join(ASSETS_DIR, png_rel)
+        if png_data is None:
+            shutil.copyfile(src_path, png_path)
+            png_bytes = src_bytes
+            copied_source = True
+        else:
+            write_bytes(png_path, png_data)
+            png_bytes = len(png_data)
+
+        variant = {
+            'scale': scale,
+            'width': size[0],
+            'height': size[1],
+            'png': png_rel,
+            'pngBytes': png_bytes,
+            'src': png_rel,
+        }
+        # WebP 只在比 PNG 小时保留，srcset 按每个倍率选最小的文件
+        webp_data = encode(resized, **WEBP_OPTIONS)
+        if len(webp_data) < png_bytes:
+            webp_rel = f"display/{folder}/{base}.webp"
+            write_bytes(os.path.join(ASSETS_DIR, webp_rel), webp_data)
+            variant.update({'webp': webp_rel, 'webpBytes': len(webp_data), 'src': webp_rel})
+        variants.append(variant)
+
+        if copied_source:
+            break
+
+    return {
+        'source': f"{folder}/{fname}",
+        'sourceWidth': src_size[0],
+        'sourceHeight': src_size[1],
+        'sourceBytes': src_bytes,
+        'variants': variants,
+        'srcset': {
+            'png': ', '.join(f"{v['png']} {format_scale(v['scale'])}" for v in variants),
+            'smallest': ', '.join(f"{v['src']} {format_scale(v['scale'])}" for v in variants),
+        },
+    }
+
+
+def prune_outputs(folder, entries):
+    """删除清单中不再引用的旧变体（原图被删除或改名后遗留的文件）"""
+    out_dir = os.path.join(OUTPUT_DIR, folder)
+    keep = set()
+    for entry in entries.values():
+        for v in entry['variants']:
+            keep.update(os.path.basename(v[key]) for key in ('png', 'webp') if key in v)
+    removed = 0
+    for fname in os.listdir(out_dir):
+        if fname not in keep:
+            os.remove(os.path.join(out_dir, fname))
+            removed += 1
+    return removed
+
+
+def process_folder(folder, previous, force=False):
+    """处理单个目录，返回 (folder, 清单条目, 生成图片数, 失败文件列表)"""
+    src_dir = os.path.join(ASSETS_DIR, folder)
+    os.makedirs(os.path.join(OUTPUT_DIR, folder), exist_ok=True)
+    box = DISPLAY_BOXES[folder]
+
+    entries = {}
+    built = 0
+    errors = []
+    for fname in sorted(os.listdir(src_dir)):
+        if not fname.lower().endswith('.png'):
+            continue
+        name = os.path.splitext(fname)[0]
+        src_path = os.path.join(src_dir, fname)
+
+        if not force and is_entry_up_to_date(previous.get(name), src_path):
+            entries[name] = previous[name]
+            continue
+        try:
+            entries[name] = build_variants(folder, fname, box)
+            built += 1
+        except Exception as e:
+            errors.append(f"{fname}: {e}")
+
+    prune_outputs(folder, entries)
+    return folder, entries, built, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description='生成角色立绘显示尺寸变体')
+    parser.add_argument('--force', action='store_true', help='忽略时间戳，重新生成全部变体')
+    parser.add_argument('--workers', type=int, default=len(DISPLAY_BOXES), help='并行进程数')
+    args = parser.parse_args()
+
+    folders = [f for f in DISPLAY_BOXES if os.path.isdir(os.path.join(ASSETS_DIR, f))]
+    for missing in set(DISPLAY_BOXES) - set(folders):
+        print(f"⊘ 目录不存在: assets/{missing}")
+
+    previous = {}
+    if not args.force and os.path.exists(MANIFEST_PATH):
+        try:
+            with open(MANIFEST_PATH, 'r', encoding='utf-8') as f:
+                previous = json.load(f).get('folders', {})
+        except Exception as e:
+            print(f"⊘ 无法读取旧清单，将全部重新生成: {e}")
+
+    results = {}
+    failed = False
+    with ProcessPoolExecutor(max_workers=max(1, args.workers)) as executor:
+        futures = {
+            executor.submit(process_folder, f, previous.get(f, {}), args.force): f
+            for f in folders
+        }
+        for future in as_completed(futures):
+            folder = futures[future]
+            try:
+                _, entries, built, errors = future.result()
+            except Exception as e:
+                print(f"✗ 处理失败 assets/{folder}: {e}")
+                failed = True
+                continue
+            results[folder] = entries
+            print(f"✓ assets/{folder}: {len(entries)} 张图片，重新生成 {built} 张")
+            for error in errors:
+                print(f"  ✗ {error}")
+            failed = failed or bool(errors)
+
+    # 保持清单内容稳定，便于比对；boxes 只列出成功处理的目录
+    manifest = {
+        'scales': list(SCALES),
+        'boxes': {f: {'width': DISPLAY_BOXES[f][0], 'height': DISPLAY_BOXES[f][1]} for f in sorted(results)},
+        'folders': dict(sorted(results.items())),
+    }
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    with open(MANIFEST_PATH, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    print(f"✓ 已生成清单: {os.path.relpath(MANIFEST_PATH, ROOT_DIR)}")
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
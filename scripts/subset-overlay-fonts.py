@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""按前台可能显示的文字裁剪自定义字体，生成 WOFF2 子集
+
+完整的中文字体通常有 10~20 MB，每个前台页面通过 FontFace 加载时都要重新解析。
+本脚本收集前台会显示的文字（roles.json 角色名、assets/map 地图名、i18n 文案、
+前台页面文字以及用户提供的队伍/选手名），只保留这些字形输出 WOFF2。
+结果按 “字体哈希 + 字形集合哈希” 缓存，重复运行不会重新裁剪。
+
+用法:
+  python scripts/subset-overlay-fonts.py 字体.ttf [字体2.otf ...] \\
+      [--text "队伍名 选手名"] [--text-file names.txt] [--text-file layout.json] \\
+      [--output 输出目录]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+
+try:
+    from fontTools import subset
+except ImportError:
+    print("✗ 需要安装fontTools库")
+    print("  运行: pip install fonttools brotli")
+    sys.exit(1)
+
+# 路径定义（相对于仓库根目录）
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+ROLES_PATH = os.path.join(ROOT_DIR, 'roles.json')
+MAP_DIR = os.path.join(ROOT_DIR, 'assets', 'map')
+DEFAULT_OUTPUT_DIR = os.path.join(ROOT_DIR, 'fonts-subset')
+
+# 前台页面及其文案来源，直接收集其中全部非 ASCII 字符
+OVERLAY_TEXT_SOURCES = [
+    'pages/js/i18n.js',
+    'pages/js/local-bp-i18n.js',
+    'pages/frontend.html',
+    'pages/js/frontend-main.js',
+    'pages/scoreboard.html',
+    'pages/js/scoreboard-logic.js',
+    'pages/scoreboard-overview.html',
+    'pages/js/scoreboard-overview-logic.js',
+    'pages/postmatch.html',
+    'pages/js/postmatch-logic.js',
+    'pages/character-display.html',
+    'pages/js/character-display-logic.js',
+    'pages/map-display.html',
+]
+
+# 始终保留的字符：可打印 ASCII 与常用全角标点
+BASE_CHARS = ''.join(chr(c) for c in range(0x20, 0x7f)) + '，。、：；！？（）【】《》“”‘’…—·　'
+
+
+def collect_json_strings(value, out):
+    if isinstance(value, str):
+        out.append(value)
+    elif isinstance(value, dict):
+        for item in value.values():
+            collect_json_strings(item, out)
+    elif isinstance(value, list):
+        for item in value:
+            collect_json_strings(item, out)
+
+
+def read_text_file(path):
+    """读取用户提供的名字文件；.json 文件收集其中全部字符串值"""
+    with open(path, 'r', encoding='utf-8') as f:
+        if not path.lower().endswith('.json'):
+            return f.read()
+        strings = []
+        collect_json_strings(json.load(f), strings)
+        return '\n'.join(strings)
+
+
+def collect_glyphs(extra_texts):
+    """返回需要保留的字符集合"""
+    chars = set(BASE_CHARS)
+
+    if os.path.exists(ROLES_PATH):
+        with open(ROLES_PATH, 'r', encoding='utf-8') as f:
+            strings = []
+            collect_json_strings(json.load(f), strings)
+        chars.update(''.join(strings))
+
+    if os.path.isdir(MAP_DIR):
+        for fname in os.listdir(MAP_DIR):
+            chars.update(os.path.splitext(fname)[0])
+
+    for rel in OVERLAY_TEXT_SOURCES:
+        path = os.path.join(ROOT_DIR, rel)
+        if not os.path.exists(path):
+            print(f"⊘ 文件不存在: {rel}")
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            chars.update(c for c in f.read() if ord(c) > 0x7f)
+
+    for text in extra_texts:
+        chars.update(text)
+
+    # 去掉控制字符
+    return {c for c in chars if c.isprintable() or c == '　'}
+
+
+def file_sha256(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def glyph_set_sha256(chars):
+    return hashlib.sha256(''.join(sorted(chars)).encode('utf-8')).hexdigest()
+
+
+def subset_font(font_path, unicodes, out_path):
+    options = subset.Options()
+    options.flavor = 'woff2'
+    options.layout_features = ['*']
+    # 保留 name 表，FontFace 与系统字体列表仍能识别字体名
+    options.name_IDs = ['*']
+    options.name_languages = ['*']
+    options.notdef_outline = True
+
+    font = subset.load_font(font_path, options)
+    try:
+        subsetter = subset.Subsetter(options)
+        subsetter.populate(unicodes=unicodes)
+        subsetter.subset(font)
+        subset.save_font(font, out_path, options)
+    finally:
+        font.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='按前台文字生成 WOFF2 字体子集')
+    parser.add_argument('fonts', nargs='+', help='字体文件（ttf/otf/woff/woff2）')
+    parser.add_argument('--text', action='append', default=[], help='额外保留的文字（队伍名、选手名等）')
+    parser.add_argument('--text-file', action='append', default=[], help='额外文字文件，.json 文件收集其中全部字符串')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT_DIR, help='输出目录')
+    parser.add_argument('--cache-dir', help='缓存目录（默认: 输出目录/.cache）')
+    args = parser.parse_args()
+
+    extra_texts = list(args.text)
+    for path in args.text_file:
+        try:
+            extra_texts.append(read_text_file(path))
+        except Exception as e:
+            print(f"✗ 读取文字文件失败 {path}: {e}")
+            return 1
+
+    chars = collect_glyphs(extra_texts)
+    unicodes = sorted(ord(c) for c in chars)
+    glyph_hash = glyph_set_sha256(chars)
+    print(f"✓ 收集到 {len(unicodes)} 个字符")
+
+    output_dir = os.path.abspath(args.output)
+    cache_dir = os.path.abspath(args.cache_dir or os.path.join(output_dir, '.cache'))
+    os.makedirs(output_dir, exist_ok=True)
+    os.makedirs(cache_dir, exist_ok=True)
+
+    failed = False
+    for font_path in args.fonts:
+        if not os.path.isfile(font_path):
+            print(f"✗ 字体不存在: {font_path}")
+            failed = True
+            continue
+
+        # 保持文件名不变，main.js 以文件名作为 fontFamily
+        family = os.path.splitext(os.path.basename(font_path))[0]
+        out_path = os.path.join(output_dir, f"{family}.woff2")
+        if os.path.abspath(font_path) == out_path:
+            print(f"✗ 输出会覆盖原字体，请更换输出目录: {font_path}")
+            failed = True
+            continue
+        cache_key = f"{file_sha256(font_path)[:16]}-{glyph_hash[:16]}"
+        cache_path = os.path.join(cache_dir, f"{cache_key}.woff2")
+
+        try:
+            if os.path.exists(cache_path):
+                status = '缓存命中'
+            else:
+                tmp_path = cache_path + '.tmp'
+                subset_font(font_path, unicodes, tmp_path)
+                os.replace(tmp_path, cache_path)
+                status = '已生成'
+            shutil.copyfile(cache_path, out_path)
+        except Exception as e:
+            print(f"✗ 裁剪失败 {font_path}: {e}")
+            failed = True
+            continue
+
+        src_kb = os.path.getsize(font_path) / 1024
+        out_kb = os.path.getsize(out_path) / 1024
+        print(f"✓ {status}: {os.path.basename(out_path)}  {src_kb:.2f} KB → {out_kb:.2f} KB")
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())